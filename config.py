@@ -8,6 +8,10 @@ SCRAPING_CONFIG = {
     'rate_limit_min': 2,
     'rate_limit_max': 5,
     'selenium_wait_time': 10,
+    'selenium_pool_size': 3,
+    'selenium_fallback_threshold': 5,
+    'max_in_flight_per_host': 4,
+    'max_workers': 10,
     'max_retries': 3
 }
 
@@ -70,7 +74,7 @@ RELEVANT_KEYWORDS = [
     'startup', 'venture capital', 'vc', 'investment', 'funding', 'ipo',
     'merger', 'acquisition', 'm&a', 'deal', 'partnership',
     'market', 'trading', 'stock', 'equity', 'bond', 'derivative',
-    'risk', 'compliance', 'regulation', 'regulatory', 'compliance',
+    'risk', 'compliance', 'regulation', 'regulatory',
     'banking', 'finance', 'financial', 'bank', 'lending', 'credit',
     
     # Industry specific
@@ -102,7 +106,14 @@ USER_AGENTS = [
 OUTPUT_CONFIG = {
     'csv_filename': 'ft_technology_articles.csv',
     'json_filename': 'ft_technology_articles.json',
+    'jsonl_filename': 'ft_technology_articles.jsonl',
     'excel_filename': 'ft_technology_articles.xlsx',
+    'parquet_filename': 'ft_technology_articles.parquet',
+    'write_excel': False,
+    'write_parquet': False,
+    # Bloom filter of URLs saved by earlier runs, e.g. 'ft_seen_urls.bloom';
+    # when set, later runs only collect articles not saved before
+    'seen_urls_filename': None,
     'encoding': 'utf-8'
 }
 
@@ -1,13 +1,15 @@
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import random
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
-import json
+from lxml import etree, html as lxml_html
+from cssselect import GenericTranslator
+from urllib.parse import urljoin, urlparse, urlsplit
+import csv
+import orjson
 import re
 from datetime import datetime, timedelta
-from fake_useragent import UserAgent
 import logging
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -18,20 +20,165 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 import newspaper3k
 import feedparser
+import ahocorasick
+import concurrent.futures
+import dataclasses
+import queue
+from threading import Lock
+from host_limits import HostRateLimiter
+
+try:
+    from config import SCRAPING_CONFIG, RELEVANT_KEYWORDS, USER_AGENTS
+except ImportError:
+    SCRAPING_CONFIG = {}
+    RELEVANT_KEYWORDS = [
+        'technology', 'tech', 'ai', 'artificial intelligence', 'machine learning',
+        'fintech', 'financial technology', 'blockchain', 'cryptocurrency',
+        'cybersecurity', 'digital', 'software', 'hardware', 'semiconductor',
+        'cloud', 'data', 'analytics', 'automation', 'innovation',
+        'startup', 'venture capital', 'investment', 'market', 'trading',
+        'risk', 'compliance', 'regulation', 'banking', 'finance'
+    ]
+    USER_AGENTS = [
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    ]
+
+# Per-site extraction settings; 'date_tag' is None for sites without dates
+SITE_PROFILES = {
+    'ft': {
+        'url': 'https://www.ft.com/technology',
+        'source': 'Financial Times',
+        'category': 'Technology',
+        'selectors': (
+            'article[data-trackable="article"]',
+            '.js-teaser',
+            '.o-teaser',
+            '.js-article',
+            'a[href*="/content/"]',
+            '.o-teaser__heading a',
+            '.js-teaser__heading a'
+        ),
+        'date_tag': 'time'
+    },
+    'moodys': {
+        'url': 'https://www.moodys.com/researchandratings/region/004001/005000010',
+        'source': 'Moody\'s',
+        'category': 'Credit Ratings',
+        'selectors': (
+            '.research-item',
+            '.article-item',
+            '.news-item',
+            'a[href*="/researchandratings/"]',
+            '.content-item'
+        ),
+        'date_tag': None
+    },
+    'risknet': {
+        'url': 'https://www.risk.net/',
+        'source': 'Risk.net',
+        'category': 'Risk Management',
+        'selectors': (
+            '.article-item',
+            '.news-item',
+            '.content-item',
+            'a[href*="/article/"]',
+            '.teaser'
+        ),
+        'date_tag': None
+    },
+    'spglobal': {
+        'url': 'https://www.spglobal.com/spdji/en/indices/equity/sp-500-information-technology-sector/#news-research',
+        'source': 'S&P Global',
+        'category': 'Market Data',
+        'selectors': (
+            '.news-item',
+            '.article-item',
+            '.content-item',
+            'a[href*="/news/"]',
+            '.teaser'
+        ),
+        'date_tag': None
+    }
+}
+
+# Join each site's selectors once so a page's DOM is traversed a single time,
+# and compile them to XPath at import rather than on every page
+css_translator = GenericTranslator()
+for profile in SITE_PROFILES.values():
+    profile['compound_selector'] = ', '.join(profile['selectors'])
+    profile['compound_xpath'] = etree.XPath(css_translator.css_to_xpath(profile['compound_selector']))
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+FIRST_HEADING_XPATH = etree.XPath('(' + ' | '.join(f'.//{tag}' for tag in HEADING_TAGS) + ')[1]')
+URL_HTTP_RE = re.compile(r'^https?://')
+
+RSS_FEEDS = [
+    'https://www.ft.com/rss/home',
+    'https://www.ft.com/rss/technology',
+    'https://www.ft.com/rss/companies',
+    'https://www.ft.com/rss/markets'
+]
+
+@dataclasses.dataclass(slots=True)
+class Article:
+    """A single scraped article"""
+    source: str
+    title: str
+    url: str
+    summary: str
+    date: str
+    category: str
+
+ARTICLE_FIELDS = [field.name for field in dataclasses.fields(Article)]
+
+def canonicalize_url(url):
+    """Normalise a URL so tracking parameters and fragments do not defeat de-duplication"""
+    parts = urlsplit(url)
+    return parts._replace(
+        scheme=parts.scheme.lower(),
+        netloc=parts.netloc.lower(),
+        query='',
+        fragment=''
+    ).geturl()
+
+def parse_html(content):
+    """Parse an HTML document into an lxml tree, or None if it is empty"""
+    try:
+        return lxml_html.document_fromstring(content)
+    except etree.ParserError:
+        return None
+
+def element_text(element):
+    """Get the whitespace-normalised text of an element"""
+    return ' '.join(element.text_content().split())
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class FinancialNewsScraper:
+class FinancialNewsScraper(HostRateLimiter):
     def __init__(self, min_articles=100, max_articles=150):
         self.min_articles = min_articles
         self.max_articles = max_articles
         self.articles = []
-        self.ua = UserAgent()
+        
+        # Match all relevance keywords in a single pass over the text
+        self.keyword_automaton = ahocorasick.Automaton()
+        for keyword in RELEVANT_KEYWORDS:
+            self.keyword_automaton.add_word(keyword.casefold(), keyword)
+        self.keyword_automaton.make_automaton()
+        
+        # Per-host rate limiting so distinct domains can be fetched concurrently,
+        # with a cap on concurrent requests so the fan-out cannot trigger 429 storms
+        self._init_host_limits(
+            SCRAPING_CONFIG.get('rate_limit_min', 2),
+            SCRAPING_CONFIG.get('rate_limit_max', 5),
+            SCRAPING_CONFIG.get('max_in_flight_per_host', 4)
+        )
+        
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': self.ua.random,
+            'User-Agent': random.choice(USER_AGENTS),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
@@ -39,395 +186,283 @@ class FinancialNewsScraper:
             'Upgrade-Insecure-Requests': '1',
         })
         
-        # Initialize Selenium driver for dynamic content
-        self.driver = None
-        self.setup_selenium()
-        
-    def setup_selenium(self):
-        """Set up Selenium WebDriver for dynamic content"""
+        # Pool keep-alive connections per host and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Pool of Selenium drivers for dynamic content, started on first use
+        self.driver_pool = queue.Queue()
+        self.driver_count = 0
+        self.selenium_lock = Lock()
+        self.selenium_initialized = False
+        
+    def setup_selenium(self, pool_size=1):
+        """Set up a pool of Selenium WebDrivers for dynamic content"""
         try:
             chrome_options = Options()
             chrome_options.add_argument("--headless")
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument(f"--user-agent={self.ua.random}")
+            chrome_options.add_argument(f"--user-agent={random.choice(USER_AGENTS)}")
+            
+            # Only the HTML is needed, so skip images, stylesheets and fonts
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.managed_default_content_settings.fonts": 2
+            })
+            chrome_options.page_load_strategy = 'eager'
             
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            logger.info("Selenium WebDriver initialized successfully")
+            driver_path = ChromeDriverManager().install()
+            for _ in range(pool_size):
+                driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+                self.driver_pool.put(driver)
+                self.driver_count += 1
+            logger.info(f"Selenium WebDriver pool initialized with {pool_size} drivers")
         except Exception as e:
             logger.error(f"Failed to initialize Selenium: {e}")
-            self.driver = None
     
     def get_page_with_selenium(self, url, wait_time=10):
         """Get page content using Selenium for dynamic content"""
-        if not self.driver:
+        # Selenium is only a fallback, so Chrome is started the first time a
+        # page actually needs rendering
+        with self.selenium_lock:
+            if not self.selenium_initialized:
+                self.setup_selenium(SCRAPING_CONFIG.get('selenium_pool_size', 3))
+                self.selenium_initialized = True
+        
+        if not self.driver_count:
             return None
-            
+        
+        # Each thread borrows its own driver; WebDrivers are not thread-safe
+        driver = self.driver_pool.get()
+        host = urlparse(url).netloc
         try:
-            self.driver.get(url)
-            WebDriverWait(self.driver, wait_time).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            return self.driver.page_source
+            with self._host_semaphore(host):
+                self._pace(host)
+                driver.get(url)
+                WebDriverWait(driver, wait_time).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+                return driver.page_source
         except Exception as e:
             logger.error(f"Selenium error for {url}: {e}")
             return None
+        finally:
+            self.driver_pool.put(driver)
     
     def get_page_content(self, url, use_selenium=False):
         """Get page content with fallback options"""
+        # HTTP responses are returned as raw bytes so lxml can honour the
+        # document's own encoding declaration
         try:
             if use_selenium:
                 content = self.get_page_with_selenium(url)
                 if content:
                     return content
             
-            response = self.session.get(url, timeout=30)
+            host = urlparse(url).netloc
+            with self._host_semaphore(host):
+                self._pace(host)
+                response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return response.text
+            return response.content
         except Exception as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
     
-    def extract_ft_articles(self, url):
-        """Extract articles from Financial Times"""
-        logger.info(f"Scraping Financial Times: {url}")
-        content = self.get_page_content(url, use_selenium=True)
-        if not content:
-            return []
-        
-        soup = BeautifulSoup(content, 'html.parser')
-        articles = []
-        
-        # FT article selectors
-        article_selectors = [
-            'article[data-trackable="article"]',
-            '.js-teaser',
-            '.o-teaser',
-            '.js-article',
-            'a[href*="/content/"]',
-            '.o-teaser__heading a',
-            '.js-teaser__heading a'
-        ]
-        
-        for selector in article_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                try:
-                    # Extract link
-                    link_elem = element.find('a') if element.name != 'a' else element
-                    if not link_elem or not link_elem.get('href'):
-                        continue
-                    
-                    link = link_elem.get('href')
-                    if not link.startswith('http'):
-                        link = urljoin(url, link)
-                    
-                    # Extract title
-                    title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']) or element
-                    title = title_elem.get_text(strip=True) if title_elem else ""
-                    
-                    if not title or len(title) < 10:
-                        continue
-                    
-                    # Extract summary/description
-                    summary_elem = element.find(['p', '.o-teaser__standfirst', '.js-teaser__standfirst'])
-                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                    
-                    # Extract date
-                    date_elem = element.find(['time', '.o-teaser__timestamp', '.js-teaser__timestamp'])
-                    date = date_elem.get('datetime') or date_elem.get_text(strip=True) if date_elem else ""
-                    
-                    articles.append({
-                        'source': 'Financial Times',
-                        'title': title,
-                        'url': link,
-                        'summary': summary,
-                        'date': date,
-                        'category': 'Technology'
-                    })
-                    
-                except Exception as e:
-                    logger.error(f"Error extracting FT article: {e}")
-                    continue
-        
-        return articles
+    def get_page_tree(self, url, article_xpath):
+        """Get parsed page over HTTP, falling back to Selenium for JS-rendered pages"""
+        content = self.get_page_content(url, use_selenium=False)
+        tree = parse_html(content) if content else None
+        
+        threshold = SCRAPING_CONFIG.get('selenium_fallback_threshold', 5)
+        if tree is None or len(article_xpath(tree)) < threshold:
+            logger.info(f"Static HTML incomplete for {url}, rendering with Selenium")
+            rendered = self.get_page_with_selenium(url)
+            rendered_tree = parse_html(rendered) if rendered else None
+            if rendered_tree is not None:
+                tree = rendered_tree
+        
+        return tree
     
-    def extract_moodys_articles(self, url):
-        """Extract articles from Moody's"""
-        logger.info(f"Scraping Moody's: {url}")
-        content = self.get_page_content(url, use_selenium=True)
-        if not content:
+    def _extract(self, url, profile):
+        """Extract articles from a listing page described by a site profile"""
+        logger.info(f"Scraping {profile['source']}: {url}")
+        tree = self.get_page_tree(url, profile['compound_xpath'])
+        if tree is None:
             return []
         
-        soup = BeautifulSoup(content, 'html.parser')
         articles = []
         
-        # Moody's article selectors
-        article_selectors = [
-            '.research-item',
-            '.article-item',
-            '.news-item',
-            'a[href*="/researchandratings/"]',
-            '.content-item'
-        ]
+        # Hoist lookups out of the per-element loop
+        append_article = articles.append
+        is_absolute = URL_HTTP_RE.match
+        _urljoin = urljoin
+        source = profile['source']
+        category = profile['category']
+        date_tag = profile['date_tag']
         
-        for selector in article_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                try:
-                    link_elem = element.find('a') if element.name != 'a' else element
-                    if not link_elem or not link_elem.get('href'):
-                        continue
-                    
-                    link = link_elem.get('href')
-                    if not link.startswith('http'):
-                        link = urljoin(url, link)
-                    
-                    title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']) or element
-                    title = title_elem.get_text(strip=True) if title_elem else ""
-                    
-                    if not title or len(title) < 10:
-                        continue
-                    
-                    summary_elem = element.find('p')
-                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                    
-                    articles.append({
-                        'source': 'Moody\'s',
-                        'title': title,
-                        'url': link,
-                        'summary': summary,
-                        'date': '',
-                        'category': 'Credit Ratings'
-                    })
-                    
-                except Exception as e:
-                    logger.error(f"Error extracting Moody's article: {e}")
+        for element in profile['compound_xpath'](tree):
+            try:
+                # Extract link
+                link_elem = element.find('.//a') if element.tag != 'a' else element
+                link = link_elem.get('href') if link_elem is not None else None
+                if not link:
                     continue
+                
+                if not is_absolute(link):
+                    link = _urljoin(url, link)
+                
+                # Extract title
+                headings = FIRST_HEADING_XPATH(element)
+                title = element_text(headings[0] if headings else element)
+                
+                if not title or len(title) < 10:
+                    continue
+                
+                # Extract summary/description
+                summary_elem = element.find('.//p')
+                summary = element_text(summary_elem) if summary_elem is not None else ""
+                
+                # Extract date
+                date = ""
+                if date_tag:
+                    date_elem = element.find(f'.//{date_tag}')
+                    if date_elem is not None:
+                        date = date_elem.get('datetime') or element_text(date_elem)
+                
+                append_article(Article(
+                    source=source,
+                    title=title,
+                    url=link,
+                    summary=summary,
+                    date=date,
+                    category=category
+                ))
+                
+            except Exception as e:
+                logger.error(f"Error extracting {source} article: {e}")
+                continue
         
         return articles
     
-    def extract_risknet_articles(self, url):
-        """Extract articles from Risk.net"""
-        logger.info(f"Scraping Risk.net: {url}")
-        content = self.get_page_content(url, use_selenium=True)
-        if not content:
-            return []
-        
-        soup = BeautifulSoup(content, 'html.parser')
+    def scrape_rss_feed(self, feed_url):
+        """Scrape a single RSS feed"""
         articles = []
-        
-        # Risk.net article selectors
-        article_selectors = [
-            '.article-item',
-            '.news-item',
-            '.content-item',
-            'a[href*="/article/"]',
-            '.teaser'
-        ]
-        
-        for selector in article_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                try:
-                    link_elem = element.find('a') if element.name != 'a' else element
-                    if not link_elem or not link_elem.get('href'):
-                        continue
-                    
-                    link = link_elem.get('href')
-                    if not link.startswith('http'):
-                        link = urljoin(url, link)
-                    
-                    title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']) or element
-                    title = title_elem.get_text(strip=True) if title_elem else ""
-                    
-                    if not title or len(title) < 10:
-                        continue
-                    
-                    summary_elem = element.find('p')
-                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                    
-                    articles.append({
-                        'source': 'Risk.net',
-                        'title': title,
-                        'url': link,
-                        'summary': summary,
-                        'date': '',
-                        'category': 'Risk Management'
-                    })
-                    
-                except Exception as e:
-                    logger.error(f"Error extracting Risk.net article: {e}")
-                    continue
+        try:
+            logger.info(f"Scraping RSS feed: {feed_url}")
+            
+            # Fetch through the pooled session and hand feedparser the raw bytes
+            host = urlparse(feed_url).netloc
+            with self._host_semaphore(host):
+                self._pace(host)
+                response = self.session.get(feed_url, timeout=30)
+            response.raise_for_status()
+            feed = feedparser.parse(
+                response.content,
+                response_headers={key.lower(): value for key, value in response.headers.items()}
+            )
+            
+            for entry in feed.entries:
+                articles.append(Article(
+                    source='Financial Times (RSS)',
+                    title=entry.title,
+                    url=entry.link,
+                    summary=entry.summary if hasattr(entry, 'summary') else '',
+                    date=entry.published if hasattr(entry, 'published') else '',
+                    category='Technology'
+                ))
+                
+        except Exception as e:
+            logger.error(f"Error scraping RSS feed {feed_url}: {e}")
         
         return articles
     
-    def extract_spglobal_articles(self, url):
-        """Extract articles from S&P Global"""
-        logger.info(f"Scraping S&P Global: {url}")
-        content = self.get_page_content(url, use_selenium=True)
-        if not content:
-            return []
-        
-        soup = BeautifulSoup(content, 'html.parser')
-        articles = []
-        
-        # S&P Global article selectors
-        article_selectors = [
-            '.news-item',
-            '.article-item',
-            '.content-item',
-            'a[href*="/news/"]',
-            '.teaser'
-        ]
-        
-        for selector in article_selectors:
-            elements = soup.select(selector)
-            for element in elements:
+    def scrape_source(self, profile):
+        """Scrape a single source (for parallel processing)"""
+        return self._extract(profile['url'], profile)
+    
+    def scrape_all_sources(self, stream_filename='financial_articles.jsonl'):
+        """Scrape all sources and collect articles, streaming them to a JSONL file"""
+        self.articles = []
+        seen_urls = set()
+        limited = False
+        
+        # Sources are independent and I/O-bound, so fetch them concurrently
+        # together with the RSS feeds; rate limiting is applied per host
+        with open(stream_filename, 'wb') as stream, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                (executor.submit(self.scrape_source, profile), profile['url'])
+                for profile in SITE_PROFILES.values()
+            ]
+            futures.extend(
+                (executor.submit(self.scrape_rss_feed, feed_url), feed_url)
+                for feed_url in RSS_FEEDS
+            )
+            
+            # Results are consumed in submission order, so max_articles is
+            # filled from the sites first and then RSS, whatever finishes first
+            for future, url in futures:
                 try:
-                    link_elem = element.find('a') if element.name != 'a' else element
-                    if not link_elem or not link_elem.get('href'):
-                        continue
-                    
-                    link = link_elem.get('href')
-                    if not link.startswith('http'):
-                        link = urljoin(url, link)
-                    
-                    title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']) or element
-                    title = title_elem.get_text(strip=True) if title_elem else ""
-                    
-                    if not title or len(title) < 10:
-                        continue
-                    
-                    summary_elem = element.find('p')
-                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                    
-                    articles.append({
-                        'source': 'S&P Global',
-                        'title': title,
-                        'url': link,
-                        'summary': summary,
-                        'date': '',
-                        'category': 'Market Data'
-                    })
-                    
+                    articles = future.result()
+                    logger.info(f"Found {len(articles)} articles from {url}")
                 except Exception as e:
-                    logger.error(f"Error extracting S&P Global article: {e}")
+                    logger.error(f"Error scraping {url}: {e}")
                     continue
-        
-        return articles
-    
-    def scrape_rss_feeds(self):
-        """Scrape RSS feeds for additional articles"""
-        rss_feeds = [
-            'https://www.ft.com/rss/home',
-            'https://www.ft.com/rss/technology',
-            'https://www.ft.com/rss/companies',
-            'https://www.ft.com/rss/markets'
-        ]
-        
-        articles = []
-        for feed_url in rss_feeds:
-            try:
-                logger.info(f"Scraping RSS feed: {feed_url}")
-                feed = feedparser.parse(feed_url)
                 
-                for entry in feed.entries:
-                    articles.append({
-                        'source': 'Financial Times (RSS)',
-                        'title': entry.title,
-                        'url': entry.link,
-                        'summary': entry.summary if hasattr(entry, 'summary') else '',
-                        'date': entry.published if hasattr(entry, 'published') else '',
-                        'category': 'Technology'
-                    })
-                    
-            except Exception as e:
-                logger.error(f"Error scraping RSS feed {feed_url}: {e}")
-                continue
-        
-        return articles
-    
-    def scrape_all_sources(self):
-        """Scrape all sources and collect articles"""
-        sources = [
-            ('https://www.ft.com/technology', self.extract_ft_articles),
-            ('https://www.moodys.com/researchandratings/region/004001/005000010', self.extract_moodys_articles),
-            ('https://www.risk.net/', self.extract_risknet_articles),
-            ('https://www.spglobal.com/spdji/en/indices/equity/sp-500-information-technology-sector/#news-research', self.extract_spglobal_articles)
-        ]
-        
-        all_articles = []
-        
-        # Scrape main sources
-        for url, extractor_func in sources:
-            try:
-                articles = extractor_func(url)
-                all_articles.extend(articles)
-                logger.info(f"Found {len(articles)} articles from {url}")
+                # Remove duplicates based on canonical URL
+                unique_articles = []
+                for article in articles:
+                    canonical_url = canonicalize_url(article.url)
+                    if canonical_url not in seen_urls:
+                        seen_urls.add(canonical_url)
+                        unique_articles.append(article)
                 
-                # Rate limiting
-                time.sleep(random.uniform(2, 5))
-                
-            except Exception as e:
-                logger.error(f"Error scraping {url}: {e}")
-                continue
-        
-        # Scrape RSS feeds
-        rss_articles = self.scrape_rss_feeds()
-        all_articles.extend(rss_articles)
-        logger.info(f"Found {len(rss_articles)} articles from RSS feeds")
-        
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_articles = []
-        for article in all_articles:
-            if article['url'] not in seen_urls:
-                seen_urls.add(article['url'])
-                unique_articles.append(article)
-        
-        # Filter and limit articles
-        filtered_articles = self.filter_articles(unique_articles)
+                # Filter and limit articles, writing each accepted one straight
+                # away so partial results survive an interrupted scrape
+                for article in self.filter_articles(unique_articles):
+                    if len(self.articles) >= self.max_articles:
+                        limited = True
+                        break
+                    self.articles.append(article)
+                    stream.write(orjson.dumps(article) + b'\n')
+                stream.flush()
         
         # Ensure we have enough articles
-        if len(filtered_articles) < self.min_articles:
-            logger.warning(f"Only found {len(filtered_articles)} articles, less than minimum {self.min_articles}")
+        if len(self.articles) < self.min_articles:
+            logger.warning(f"Only found {len(self.articles)} articles, less than minimum {self.min_articles}")
         
-        # Limit to maximum
-        if len(filtered_articles) > self.max_articles:
-            filtered_articles = filtered_articles[:self.max_articles]
+        if limited:
             logger.info(f"Limited to {self.max_articles} articles")
         
-        self.articles = filtered_articles
-        return filtered_articles
+        return self.articles
     
     def filter_articles(self, articles):
         """Filter articles based on relevance and quality"""
         filtered = []
         
-        # Keywords for relevance
-        relevant_keywords = [
-            'technology', 'tech', 'ai', 'artificial intelligence', 'machine learning',
-            'fintech', 'financial technology', 'blockchain', 'cryptocurrency',
-            'cybersecurity', 'digital', 'software', 'hardware', 'semiconductor',
-            'cloud', 'data', 'analytics', 'automation', 'innovation',
-            'startup', 'venture capital', 'investment', 'market', 'trading',
-            'risk', 'compliance', 'regulation', 'banking', 'finance'
-        ]
-        
         for article in articles:
-            title_lower = article['title'].lower()
-            summary_lower = article['summary'].lower()
+            # Newline separator stops keywords matching across title and summary
+            text = (article.title + '\n' + article.summary).casefold()
             
             # Check if article contains relevant keywords
-            is_relevant = any(keyword in title_lower or keyword in summary_lower 
-                            for keyword in relevant_keywords)
+            is_relevant = next(self.keyword_automaton.iter(text), None) is not None
             
             # Additional quality checks
-            has_minimum_length = len(article['title']) >= 10
-            has_valid_url = article['url'].startswith('http')
+            has_minimum_length = len(article.title) >= 10
+            has_valid_url = article.url.startswith('http')
             
             if is_relevant and has_minimum_length and has_valid_url:
                 filtered.append(article)
@@ -440,8 +475,10 @@ class FinancialNewsScraper:
             logger.warning("No articles to save")
             return
         
-        df = pd.DataFrame(self.articles)
-        df.to_csv(filename, index=False, encoding='utf-8')
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(ARTICLE_FIELDS)
+            writer.writerows(dataclasses.astuple(article) for article in self.articles)
         logger.info(f"Saved {len(self.articles)} articles to {filename}")
     
     def save_to_json(self, filename='financial_articles.json'):
@@ -450,8 +487,8 @@ class FinancialNewsScraper:
             logger.warning("No articles to save")
             return
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.articles, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(self.articles, option=orjson.OPT_INDENT_2))
         logger.info(f"Saved {len(self.articles)} articles to {filename}")
     
     def print_summary(self):
@@ -466,7 +503,7 @@ class FinancialNewsScraper:
         # Group by source
         source_counts = {}
         for article in self.articles:
-            source = article['source']
+            source = article.source
             source_counts[source] = source_counts.get(source, 0) + 1
         
         print("\nArticles by source:")
@@ -477,8 +514,9 @@ class FinancialNewsScraper:
     
     def cleanup(self):
         """Clean up resources"""
-        if self.driver:
-            self.driver.quit()
+        while self.driver_count:
+            self.driver_pool.get().quit()
+            self.driver_count -= 1
             logger.info("Selenium WebDriver closed")
 
 def main():
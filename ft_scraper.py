@@ -1,10 +1,14 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import time
 import random
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
-import json
+import soupsieve
+from urllib.parse import urljoin, urlparse, urlsplit
+import orjson
+import csv
 import re
 from datetime import datetime, timedelta
 from fake_useragent import UserAgent
@@ -14,13 +18,16 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 import os
 import sys
 from typing import List, Dict, Optional, Tuple
 import concurrent.futures
+from pybloom_live import ScalableBloomFilter
 from threading import Lock
+from host_limits import HostRateLimiter
 
 # Import configuration
 try:
@@ -43,27 +50,74 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class FinancialTimesScraper:
+class FinancialTimesScraper(HostRateLimiter):
+    # FT-specific selectors, compiled once per process rather than per page
+    ARTICLE_SELECTORS = (
+        'article[data-trackable="article"]',
+        '.js-teaser',
+        '.o-teaser',
+        '.js-article',
+        'a[href*="/content/"]',
+        '.o-teaser__heading a',
+        '.js-teaser__heading a',
+        '.o-teaser__title a',
+        '.js-teaser__title a',
+        '.o-teaser__content a',
+        '.js-teaser__content a',
+        '.o-teaser__standfirst a',
+        '.js-teaser__standfirst a'
+    )
+    # Only links under these prefixes are treated as FT articles
+    _ALLOWED_PREFIXES = ('https://www.ft.com/',)
+    
+    # A single combined selector walks the DOM once and yields each element once
+    _COMBINED_SELECTOR = soupsieve.compile(', '.join(ARTICLE_SELECTORS))
+    
+    # Title, summary and date parts of a teaser, gathered in a single walk
+    _HEADING_SELECTOR = soupsieve.compile('h1, h2, h3, h4, h5, h6')
+    _SUMMARY_SELECTOR = soupsieve.compile('p, .o-teaser__standfirst, .js-teaser__standfirst')
+    # Timestamp containers wrap the <time> element that carries the ISO datetime,
+    # so they are only used when no <time> or datetime attribute is found
+    _DATE_SELECTOR = soupsieve.compile('time, [datetime]')
+    _TIMESTAMP_SELECTOR = soupsieve.compile('.o-teaser__timestamp, .js-teaser__timestamp')
+    _TEASER_PARTS_SELECTOR = soupsieve.compile(', '.join(
+        selector.pattern
+        for selector in (_HEADING_SELECTOR, _SUMMARY_SELECTOR, _DATE_SELECTOR, _TIMESTAMP_SELECTOR)
+    ))
+    
+    # One lazily started headless Chrome shared by every scraper instance;
+    # driver_lock serializes its use across instances and worker threads
+    driver = None
+    driver_lock = Lock()
+    selenium_initialized = False
+    
+    # All relevance keywords as one alternation, scanned by the C regex engine
+    KEYWORD_RE = re.compile('|'.join(map(re.escape, RELEVANT_KEYWORDS)), re.IGNORECASE)
+    
+    # Cheap check for FT article links before paying for a full parse
+    LINK_RE = re.compile(r'href="(?:https://www\.ft\.com)?/content/')
+    
     def __init__(self, min_articles=50, max_articles=150):
         self.min_articles = min_articles
         self.max_articles = max_articles
         self.articles = []
-        self.articles_lock = Lock()
-        self.ua = UserAgent()
+        self._frame = None
+        self.saved_files = []
+        
+        # URLs saved by previous runs, so known articles are skipped cheaply
+        self.seen_filter = self.load_seen_filter()
         self.session = requests.Session()
         
-        # Initialize session with headers
-        self.update_session_headers()
+        # Materialise the user agent pool once instead of querying fake_useragent per call
+        if 'USER_AGENTS' in globals():
+            self._ua_pool = USER_AGENTS
+        else:
+            ua = UserAgent()
+            self._ua_pool = [ua.random for _ in range(32)]
         
-        # Initialize Selenium driver
-        self.driver = None
-        self.setup_selenium()
-    
-    def update_session_headers(self):
-        """Update session headers with random user agent"""
-        user_agent = random.choice(USER_AGENTS) if 'USER_AGENTS' in globals() else self.ua.random
+        # Initialize session with headers; they are set once so urllib3 can
+        # keep reusing the pooled keep-alive connections
         self.session.headers.update({
-            'User-Agent': user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
@@ -71,6 +125,33 @@ class FinancialTimesScraper:
             'Upgrade-Insecure-Requests': '1',
             'Cache-Control': 'max-age=0',
         })
+        self.update_session_headers()
+        
+        # The adapter is the only retry layer: connection errors, 429s and 5xx
+        # responses are retried here with exponential backoff
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=SCRAPING_CONFIG.get('max_retries', 3),
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Per-host politeness: a minimum gap between requests and a cap on
+        # concurrent requests, so distinct hosts never wait on each other
+        self._init_host_limits(
+            SCRAPING_CONFIG.get('rate_limit_min', 2),
+            SCRAPING_CONFIG.get('rate_limit_max', 5),
+            SCRAPING_CONFIG.get('max_in_flight_per_host', 4)
+        )
+    
+    def update_session_headers(self):
+        """Pick a user agent for the session; browsers keep one UA per session"""
+        self.session.headers['User-Agent'] = random.choice(self._ua_pool)
     
     def setup_selenium(self):
         """Set up Selenium WebDriver for dynamic content"""
@@ -83,154 +164,182 @@ class FinancialTimesScraper:
             chrome_options.add_argument("--disable-blink-features=AutomationControlled")
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument(f"--user-agent={self.ua.random}")
+            chrome_options.add_argument(f"--user-agent={random.choice(self._ua_pool)}")
             
             service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            FinancialTimesScraper.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             logger.info("Selenium WebDriver initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Selenium: {e}")
-            self.driver = None
+            FinancialTimesScraper.driver = None
     
     def get_page_with_selenium(self, url, wait_time=10):
         """Get page content using Selenium for dynamic content"""
-        if not self.driver:
-            return None
-            
-        try:
-            self.driver.get(url)
-            WebDriverWait(self.driver, wait_time).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Scroll to load more content
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+        # Chrome is only started if a page needs JavaScript rendering, and the
+        # shared driver is used one page at a time
+        with self.driver_lock:
+            if not self.selenium_initialized:
+                self.setup_selenium()
+                FinancialTimesScraper.selenium_initialized = True
             
-            return self.driver.page_source
-        except Exception as e:
-            logger.error(f"Selenium error for {url}: {e}")
-            return None
-    
-    def get_page_content(self, url, use_selenium=False, max_retries=3):
-        """Get page content with retry logic and fallback options"""
-        for attempt in range(max_retries):
+            if not self.driver:
+                return None
+                
             try:
-                if use_selenium:
-                    content = self.get_page_with_selenium(url)
-                    if content:
-                        return content
+                self._pace(urlparse(url).netloc)
+                self.driver.get(url)
+                WebDriverWait(self.driver, wait_time).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
                 
-                # Prepare request
-                self.update_session_headers()
+                # Scroll to load more content and return as soon as teasers render
+                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                try:
+                    WebDriverWait(self.driver, 5).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, self._COMBINED_SELECTOR.pattern))
+                    )
+                except TimeoutException:
+                    logger.warning(f"No articles rendered on {url} after scrolling")
                 
+                return self.driver.page_source
+            except Exception as e:
+                logger.error(f"Selenium error for {url}: {e}")
+                return None
+    
+    def get_page_content(self, url, use_selenium=False):
+        """Get page content with fallback options; retries happen in the session adapter"""
+        try:
+            if use_selenium:
+                content = self.get_page_with_selenium(url)
+                if content:
+                    return content
+            
+            host = urlparse(url).netloc
+            with self._host_semaphore(host):
+                self._pace(host)
                 response = self.session.get(
                     url, 
                     timeout=SCRAPING_CONFIG.get('request_timeout', 30)
                 )
-                response.raise_for_status()
-                return response.text
-                
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(random.uniform(1, 3))
-                    continue
-                else:
-                    logger.error(f"All attempts failed for {url}")
-                    return None
-            except Exception as e:
-                logger.error(f"Unexpected error for {url}: {e}")
-                return None
+            response.raise_for_status()
+            return response.text
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"All attempts failed for {url}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error for {url}: {e}")
+            return None
+    
+    def _find_teaser_parts(self, element):
+        """Find the first heading, summary and date elements of a teaser in one pass"""
+        heading = summary = date = timestamp = None
+        for child in self._TEASER_PARTS_SELECTOR.iselect(element):
+            if heading is None and self._HEADING_SELECTOR.match(child):
+                heading = child
+            elif summary is None and self._SUMMARY_SELECTOR.match(child):
+                summary = child
+            elif date is None and self._DATE_SELECTOR.match(child):
+                date = child
+            elif timestamp is None and self._TIMESTAMP_SELECTOR.match(child):
+                timestamp = child
+            
+            if heading is not None and summary is not None and date is not None:
+                break
         
-        return None
+        return heading, summary, date if date is not None else timestamp
     
     def extract_ft_articles(self, url, source_name="Financial Times", category="Technology"):
         """Extract articles from Financial Times pages"""
         logger.info(f"Scraping {source_name}: {url}")
-        content = self.get_page_content(url, use_selenium=True)
-        if not content:
-            return []
         
-        soup = BeautifulSoup(content, 'html.parser')
+        # Most FT listing pages are server-rendered, so try plain HTTP first
+        # and only render with Selenium when no teasers are present. Pages
+        # without any FT content links are never handed to the parser.
+        content = self.get_page_content(url)
+        soup = None
+        if content and self.LINK_RE.search(content):
+            soup = BeautifulSoup(content, 'lxml')
+        if soup is None or self._COMBINED_SELECTOR.select_one(soup) is None:
+            logger.info(f"No articles in static HTML for {url}, rendering with Selenium")
+            content = self.get_page_with_selenium(url)
+            if not content or not self.LINK_RE.search(content):
+                return []
+            soup = BeautifulSoup(content, 'lxml')
+        
         articles = []
+        page_urls = set()
         
-        # FT-specific selectors
-        selectors = [
-            'article[data-trackable="article"]',
-            '.js-teaser',
-            '.o-teaser',
-            '.js-article',
-            'a[href*="/content/"]',
-            '.o-teaser__heading a',
-            '.js-teaser__heading a',
-            '.o-teaser__title a',
-            '.js-teaser__title a',
-            '.o-teaser__content a',
-            '.js-teaser__content a',
-            '.o-teaser__standfirst a',
-            '.js-teaser__standfirst a'
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                try:
-                    # Extract link
-                    link_elem = element.find('a') if element.name != 'a' else element
-                    if not link_elem or not link_elem.get('href'):
-                        continue
-                    
-                    link = link_elem.get('href')
-                    if not link.startswith('http'):
-                        link = urljoin(url, link)
-                    
-                    # Skip if not an FT article
-                    if not link.startswith('https://www.ft.com/'):
-                        continue
-                    
-                    # Extract title
-                    title = ""
-                    title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                    elif element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                        title = element.get_text(strip=True)
-                    else:
-                        # Try to get title from link text
-                        title = link_elem.get_text(strip=True)
-                    
-                    if not title or len(title) < 10:
-                        continue
-                    
-                    # Extract summary
-                    summary = ""
-                    summary_elem = element.find(['p', '.o-teaser__standfirst', '.js-teaser__standfirst'])
-                    if summary_elem:
-                        summary = summary_elem.get_text(strip=True)
-                    
-                    # Extract date
-                    date = ""
-                    date_elem = element.find(['time', '.o-teaser__timestamp', '.js-teaser__timestamp'])
-                    if date_elem:
-                        date = date_elem.get('datetime') or date_elem.get_text(strip=True)
-                    
-                    article = {
-                        'source': source_name,
-                        'title': title,
-                        'url': link,
-                        'summary': summary,
-                        'date': date,
-                        'category': category,
-                        'scraped_at': datetime.now().isoformat()
-                    }
-                    
-                    articles.append(article)
-                    
-                except Exception as e:
-                    logger.error(f"Error extracting article from {source_name}: {e}")
+        # Root-relative hrefs are the common case; joining them onto the page
+        # origin directly avoids urljoin's repeated URL splitting
+        page_url = urlsplit(url)
+        origin = f"{page_url.scheme}://{page_url.netloc}"
+        
+        # Guard clauses skip malformed teasers; a single handler covers the
+        # whole page so the per-element loop stays free of exception setup
+        try:
+            for element in self._COMBINED_SELECTOR.select(soup):
+                # Extract link
+                link_elem = element.find('a') if element.name != 'a' else element
+                if not link_elem or not link_elem.get('href'):
+                    continue
+                
+                link = link_elem.get('href')
+                if link.startswith('/') and not link.startswith('//'):
+                    link = origin + link
+                elif not link.startswith('http'):
+                    link = urljoin(url, link)
+                
+                # Skip if not an FT article
+                if not link.startswith(self._ALLOWED_PREFIXES):
+                    continue
+                
+                title_elem, summary_elem, date_elem = self._find_teaser_parts(element)
+                
+                # Extract title
+                title = ""
+                if title_elem:
+                    title = title_elem.get_text(strip=True)
+                elif element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+                    title = element.get_text(strip=True)
+                else:
+                    # Try to get title from link text
+                    title = link_elem.get_text(strip=True)
+                
+                if not title or len(title) < 10:
                     continue
+                
+                # Skip duplicates on this page and articles saved by earlier
+                # runs; cross-source duplicates are resolved in source order
+                # by scrape_all_sources
+                if link in page_urls or link in self.seen_filter:
+                    continue
+                page_urls.add(link)
+                
+                # Extract summary
+                summary = ""
+                if summary_elem:
+                    summary = summary_elem.get_text(strip=True)
+                
+                # Extract date
+                date = ""
+                if date_elem:
+                    date = date_elem.get('datetime') or date_elem.get_text(strip=True)
+                
+                article = {
+                    'source': source_name,
+                    'title': title,
+                    'url': link,
+                    'summary': summary,
+                    'date': date,
+                    'category': category,
+                    'scraped_at': datetime.now().isoformat()
+                }
+                
+                articles.append(article)
+        except Exception as e:
+            logger.error(f"Error extracting articles from {source_name}: {e}")
         
         return articles
     
@@ -255,59 +364,40 @@ class FinancialTimesScraper:
     def scrape_all_sources(self):
         """Scrape all sources and collect articles"""
         all_articles = []
+        seen_urls = set()
         
-        # Scrape main FT technology source
+        # Scrape the main FT technology source alongside the additional ones;
+        # politeness is enforced per host inside the fetch, not between sources
+        sources_to_scrape = []
         main_source = SOURCES.get('ft_technology', {})
         if main_source:
-            articles = self.extract_ft_articles(
-                main_source['url'],
-                main_source['name'],
-                main_source['category']
-            )
-            all_articles.extend(articles)
-            logger.info(f"Found {len(articles)} articles from main source")
-        
-        # Scrape additional sources
-        sources_to_scrape = ADDITIONAL_SOURCES if 'ADDITIONAL_SOURCES' in globals() else []
-        
-        # Use parallel processing for faster scraping
-        max_workers = min(3, len(sources_to_scrape))  # Limit concurrent requests
+            sources_to_scrape.append(main_source)
+        sources_to_scrape.extend(ADDITIONAL_SOURCES if 'ADDITIONAL_SOURCES' in globals() else [])
         
         if sources_to_scrape:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_source = {
-                    executor.submit(self.scrape_source_parallel, source_config): source_config 
-                    for source_config in sources_to_scrape
-                }
-                
-                for future in concurrent.futures.as_completed(future_to_source):
-                    source_config = future_to_source[future]
-                    try:
-                        articles = future.result()
-                        all_articles.extend(articles)
-                        
-                        # Rate limiting between sources
-                        time.sleep(random.uniform(
-                            SCRAPING_CONFIG.get('rate_limit_min', 2),
-                            SCRAPING_CONFIG.get('rate_limit_max', 5)
-                        ))
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing {source_config['name']}: {e}")
-        
-        
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_articles = []
-        for article in all_articles:
-            if article['url'] not in seen_urls:
-                seen_urls.add(article['url'])
-                unique_articles.append(article)
+            max_workers = min(SCRAPING_CONFIG.get('max_workers', 10), len(sources_to_scrape))
+            stream_filename = OUTPUT_CONFIG.get('jsonl_filename', 'ft_technology_articles.jsonl')
+            with open(stream_filename, 'wb') as stream, \
+                    concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # map keeps source order, so an article listed by several sources
+                # is always attributed to the earliest one and the main source
+                # keeps priority under max_articles
+                for articles in executor.map(self.scrape_source_parallel, sources_to_scrape):
+                    for article in articles:
+                        if article['url'] in seen_urls:
+                            continue
+                        seen_urls.add(article['url'])
+                        all_articles.append(article)
+                        # Stream each source's articles as soon as its turn
+                        # comes, so a crash mid-crawl keeps partial results
+                        stream.write(orjson.dumps(article) + b'\n')
+                    stream.flush()
         
-        logger.info(f"Total unique articles found: {len(unique_articles)}")
+        # Articles are already unique; duplicates are dropped while merging
+        logger.info(f"Total unique articles found: {len(all_articles)}")
         
         # Filter and limit articles
-        filtered_articles = self.filter_articles(unique_articles)
+        filtered_articles = self.filter_articles(all_articles)
         
         # Ensure we have enough articles
         if len(filtered_articles) < self.min_articles:
@@ -319,6 +409,7 @@ class FinancialTimesScraper:
             logger.info(f"Limited to {self.max_articles} articles")
         
         self.articles = filtered_articles
+        self._frame = None
         return filtered_articles
     
     def filter_articles(self, articles):
@@ -326,23 +417,50 @@ class FinancialTimesScraper:
         filtered = []
         
         for article in articles:
-            title_lower = article['title'].lower()
-            summary_lower = article['summary'].lower()
-            
             # Check if article contains relevant keywords
-            is_relevant = any(keyword in title_lower or keyword in summary_lower 
-                            for keyword in RELEVANT_KEYWORDS)
+            is_relevant = bool(
+                self.KEYWORD_RE.search(article['title']) or self.KEYWORD_RE.search(article['summary'])
+            )
             
-            # Additional quality checks
+            # Additional quality checks; the FT URL prefix is already enforced
+            # during extraction
             has_minimum_length = len(article['title']) >= 10
-            has_valid_url = article['url'].startswith('https://www.ft.com/')
             
-            if is_relevant and has_minimum_length and has_valid_url:
+            if is_relevant and has_minimum_length:
                 filtered.append(article)
         
         logger.info(f"Filtered {len(articles)} articles down to {len(filtered)} relevant articles")
         return filtered
     
+    def load_seen_filter(self):
+        """Load the bloom filter of previously saved article URLs"""
+        filename = OUTPUT_CONFIG.get('seen_urls_filename')
+        if filename and os.path.exists(filename):
+            with open(filename, 'rb') as f:
+                seen_filter = ScalableBloomFilter.fromfile(f)
+            logger.info(f"Loaded {len(seen_filter)} previously seen URLs from {filename}")
+            return seen_filter
+        
+        return ScalableBloomFilter(initial_capacity=10000, error_rate=0.001)
+    
+    def save_seen_filter(self):
+        """Add the collected article URLs to the bloom filter and persist it"""
+        filename = OUTPUT_CONFIG.get('seen_urls_filename')
+        if not filename:
+            return
+        
+        for article in self.articles:
+            self.seen_filter.add(article['url'])
+        with open(filename, 'wb') as f:
+            self.seen_filter.tofile(f)
+        logger.info(f"Saved seen URL filter to {filename}")
+    
+    def _to_frame(self):
+        """Build the articles DataFrame once and share it between output formats"""
+        if self._frame is None:
+            self._frame = pd.DataFrame(self.articles)
+        return self._frame
+    
     def save_to_csv(self, filename=None):
         """Save articles to CSV file"""
         if not self.articles:
@@ -350,8 +468,14 @@ class FinancialTimesScraper:
             return
         
         filename = filename or OUTPUT_CONFIG.get('csv_filename', 'ft_technology_articles.csv')
-        df = pd.DataFrame(self.articles)
-        df.to_csv(filename, index=False, encoding=OUTPUT_CONFIG.get('encoding', 'utf-8'))
+        self._to_frame().to_csv(
+            filename,
+            index=False,
+            encoding=OUTPUT_CONFIG.get('encoding', 'utf-8'),
+            lineterminator='\n',
+            quoting=csv.QUOTE_MINIMAL
+        )
+        self.saved_files.append(filename)
         logger.info(f"Saved {len(self.articles)} articles to {filename}")
     
     def save_to_json(self, filename=None):
@@ -361,8 +485,9 @@ class FinancialTimesScraper:
             return
         
         filename = filename or OUTPUT_CONFIG.get('json_filename', 'ft_technology_articles.json')
-        with open(filename, 'w', encoding=OUTPUT_CONFIG.get('encoding', 'utf-8')) as f:
-            json.dump(self.articles, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(self.articles, option=orjson.OPT_INDENT_2))
+        self.saved_files.append(filename)
         logger.info(f"Saved {len(self.articles)} articles to {filename}")
     
     def save_to_excel(self, filename=None):
@@ -372,8 +497,25 @@ class FinancialTimesScraper:
             return
         
         filename = filename or OUTPUT_CONFIG.get('excel_filename', 'ft_technology_articles.xlsx')
-        df = pd.DataFrame(self.articles)
-        df.to_excel(filename, index=False, engine='openpyxl')
+        # constant_memory streams rows to disk instead of holding the whole workbook
+        self._to_frame().to_excel(
+            filename,
+            index=False,
+            engine='xlsxwriter',
+            engine_kwargs={'options': {'constant_memory': True}}
+        )
+        self.saved_files.append(filename)
+        logger.info(f"Saved {len(self.articles)} articles to {filename}")
+    
+    def save_to_parquet(self, filename=None):
+        """Save articles to a zstd-compressed Parquet file"""
+        if not self.articles:
+            logger.warning("No articles to save")
+            return
+        
+        filename = filename or OUTPUT_CONFIG.get('parquet_filename', 'ft_technology_articles.parquet')
+        self._to_frame().to_parquet(filename, index=False, engine='pyarrow', compression='zstd')
+        self.saved_files.append(filename)
         logger.info(f"Saved {len(self.articles)} articles to {filename}")
     
     def print_summary(self):
@@ -403,9 +545,8 @@ class FinancialTimesScraper:
             print(f"  {category}: {count}")
         
         print(f"\nArticles saved to:")
-        print(f"  - {OUTPUT_CONFIG.get('csv_filename', 'ft_technology_articles.csv')}")
-        print(f"  - {OUTPUT_CONFIG.get('json_filename', 'ft_technology_articles.json')}")
-        print(f"  - {OUTPUT_CONFIG.get('excel_filename', 'ft_technology_articles.xlsx')}")
+        for filename in self.saved_files:
+            print(f"  - {filename}")
         
         # Show sample articles
         print(f"\nSample articles:")
@@ -417,9 +558,12 @@ class FinancialTimesScraper:
     
     def cleanup(self):
         """Clean up resources"""
-        if self.driver:
-            self.driver.quit()
-            logger.info("Selenium WebDriver closed")
+        with self.driver_lock:
+            if self.driver:
+                self.driver.quit()
+                FinancialTimesScraper.driver = None
+                FinancialTimesScraper.selenium_initialized = False
+                logger.info("Selenium WebDriver closed")
 
 def main():
     """Main function to run the FT scraper"""
@@ -440,7 +584,13 @@ def main():
             # Save in multiple formats
             scraper.save_to_csv()
             scraper.save_to_json()
-            scraper.save_to_excel()
+            # Excel is slow to write, so it is opt-in
+            if OUTPUT_CONFIG.get('write_excel', False):
+                scraper.save_to_excel()
+            if OUTPUT_CONFIG.get('write_parquet', False):
+                scraper.save_to_parquet()
+            # Only mark URLs as seen once every output has been written
+            scraper.save_seen_filter()
             scraper.print_summary()
         else:
             print("No articles found")
@@ -0,0 +1,33 @@
+import random
+import time
+from collections import defaultdict
+from threading import Lock, Semaphore
+
+class HostRateLimiter:
+    """Per-host politeness shared by the scrapers: a minimum gap between
+    requests and a cap on concurrent requests, so distinct hosts never
+    wait on each other"""
+
+    def _init_host_limits(self, min_gap=2, max_gap=5, max_in_flight=4):
+        """Set up the per-host pacing and in-flight limits"""
+        self._min_gap = min_gap
+        self._max_gap = max_gap
+        self._last_hit = defaultdict(float)
+        self.host_lock = Lock()
+        self._host_sems = defaultdict(lambda: Semaphore(max_in_flight))
+
+    def _host_semaphore(self, host):
+        """Get the semaphore limiting in-flight requests to host"""
+        with self.host_lock:
+            return self._host_sems[host]
+
+    def _pace(self, host):
+        """Wait until enough time has passed since the last request to host"""
+        min_gap = random.uniform(self._min_gap, self._max_gap)
+        with self.host_lock:
+            now = time.time()
+            start_at = max(now, self._last_hit[host] + min_gap)
+            self._last_hit[host] = start_at
+
+        if start_at > now:
+            time.sleep(start_at - now)